@@ -25,6 +25,8 @@ class Meeting:
         """
         self._data = meeting_data
         self._transcript: Optional[Transcript] = None
+        self._duration_minutes: Optional[int] = None
+        self._duration_minutes_computed = False
 
     @property
     def id(self) -> Optional[str]:
@@ -120,6 +122,15 @@ class Meeting:
         # represent document lifecycle, not actual meeting time
         return None
     
+    @property
+    def duration_minutes(self) -> Optional[int]:
+        """Get the meeting duration in whole minutes (cached after first access)."""
+        if not self._duration_minutes_computed:
+            duration = self.duration
+            self._duration_minutes = int(duration.total_seconds() / 60) if duration else None
+            self._duration_minutes_computed = True
+        return self._duration_minutes
+
     def _calculate_duration_from_transcript(self) -> Optional[datetime.timedelta]:
         """Calculate duration from transcript segment timestamps."""
         # Check if we have transcript data
@@ -14,6 +14,13 @@ from ..core.parser import GranolaParser, GranolaParseError
 from .tools import MCPTools
 
 
+# Reusable encoders: json.dumps() builds a new JSONEncoder on every call when
+# given formatting options. Responses are plain trees built by the tools, so
+# the circular-reference bookkeeping is skipped as well.
+_RESPONSE_ENCODER = json.JSONEncoder(separators=(',', ':'), check_circular=False)
+_RESULT_ENCODER = json.JSONEncoder(indent=2, check_circular=False)
+
+
 class MCPServer:
     """
     MCP STDIO server for exposing Granola meeting data to LLMs.
@@ -71,9 +78,10 @@ class MCPServer:
             response: JSON-RPC response object
         """
         try:
-            json_str = json.dumps(response, separators=(',', ':'))
+            json_str = _RESPONSE_ENCODER.encode(response)
             print(json_str, flush=True)
-            self.logger.debug(f"Sent response: {json_str}")
+            # Lazy %-formatting: responses can be megabytes of transcript text
+            self.logger.debug("Sent response: %s", json_str)
         except Exception as e:
             self.logger.error(f"Error sending response: {e}")
 
@@ -223,7 +231,7 @@ class MCPServer:
                     "content": [
                         {
                             "type": "text",
-                            "text": json.dumps(result, indent=2)
+                            "text": _RESULT_ENCODER.encode(result)
                         }
                     ]
                 }
@@ -317,7 +325,7 @@ class MCPServer:
 
                 try:
                     message = json.loads(line)
-                    self.logger.debug(f"Received message: {message}")
+                    self.logger.debug("Received message: %s", message)
                     
                     # Distinguish between requests and notifications
                     # Requests have an 'id' field, notifications do not
@@ -6,10 +6,12 @@ including search, retrieval, statistics, and export functionality.
 """
 
 import json
+import bisect
 import datetime
 import statistics
-from collections import defaultdict, Counter
-from typing import Dict, Any, List, Optional, Union
+from itertools import chain, combinations, islice
+from collections import defaultdict, Counter, OrderedDict
+from typing import Dict, Any, List, Optional, Sequence, Set, Tuple, Union
 from ..core.parser import GranolaParser, GranolaParseError
 from ..core.meeting import Meeting
 from ..utils.date_parser import parse_date, get_date_range
@@ -17,6 +19,37 @@ from ..core.timezone_utils import get_cst_timezone
 from ..cli.formatters.markdown import export_meeting_to_markdown
 
 
+# Timezone used for meeting times, and the open lower bound for date filters
+_CST_TZ = get_cst_timezone()
+_MIN_DT_CST = datetime.datetime.min.replace(tzinfo=_CST_TZ)
+
+# Upper bounds (inclusive, in minutes) of the duration distribution buckets;
+# anything above the last bound falls into the final "90+ min" bucket
+_DURATION_BUCKET_BOUNDS = (15, 30, 60, 90)
+_DURATION_BUCKET_LABELS = ("0-15 min", "15-30 min", "30-60 min", "60-90 min", "90+ min")
+
+# Number of date windows _positions_in_range() keeps, least recently used first out
+_WINDOW_CACHE_SIZE = 32
+
+
+def _duration_histogram(durations: List[float]) -> List[int]:
+    """
+    Count durations per distribution bucket in a single pass.
+
+    Args:
+        durations: Meeting durations in minutes
+
+    Returns:
+        List[int]: Count per bucket, in _DURATION_BUCKET_LABELS order
+    """
+    # bisect_left gives the number of bounds strictly below the duration,
+    # which is the bucket index without an if/elif ladder
+    buckets = Counter(
+        bisect.bisect_left(_DURATION_BUCKET_BOUNDS, duration) for duration in durations
+    )
+    return [buckets[index] for index in range(len(_DURATION_BUCKET_LABELS))]
+
+
 class MCPToolError(Exception):
     """Custom exception for MCP tool errors."""
     pass
@@ -30,6 +63,24 @@ class MCPTools:
     functionality optimized for LLM consumption.
     """
 
+    # Tool name -> MCPTools method implementing it
+    _TOOL_DISPATCH: Dict[str, str] = {
+        "get_recent_meetings": "get_recent_meetings",
+        "list_meetings": "list_meetings",
+        "search_meetings": "search_meetings",
+        "get_meeting": "get_meeting",
+        "get_transcript": "get_transcript",
+        "get_meeting_notes": "get_meeting_notes",
+        "list_participants": "list_participants",
+        "get_statistics": "get_statistics",
+        "export_meeting": "export_meeting",
+        "analyze_patterns": "analyze_patterns",
+        "refresh_cache": "refresh_cache",
+    }
+
+    # Tools called without arguments; any arguments sent are ignored
+    _NO_ARGUMENT_TOOLS = frozenset({"refresh_cache"})
+
     def __init__(self, parser: GranolaParser):
         """
         Initialize MCP tools with a parser instance.
@@ -39,16 +90,32 @@ class MCPTools:
         """
         self.parser = parser
         self._meetings_cache: Optional[List[Meeting]] = None
-
-    def _get_meetings(self, force_reload: bool = False) -> List[Meeting]:
+        self._meetings_by_id: Optional[Dict[str, Meeting]] = None
+        self._sorted_desc_positions: Optional[List[int]] = None
+        self._sorted_asc_keys: Optional[List[datetime.datetime]] = None
+        self._sorted_asc_positions: Optional[List[int]] = None
+        self._window_cache: Optional[OrderedDict] = None
+        self._participant_index: Optional[Dict[str, List[int]]] = None
+        self._participant_keys: Optional[List[str]] = None
+        self._participants: Optional[List[Tuple[str, ...]]] = None
+        self._participants_lower: Optional[List[Tuple[str, ...]]] = None
+        self._durations_min: Optional[Dict[int, Optional[float]]] = None
+        self._start_times: Optional[List[Optional[datetime.datetime]]] = None
+        self._start_iso: Optional[List[Optional[str]]] = None
+        self._time_buckets: Optional[List[Optional[Tuple[str, str, str, int, int]]]] = None
+        self._time_bucket_counts_memo: Optional[Tuple[Tuple[int, ...], Tuple[Counter, ...]]] = None
+        self._summary_fields: Optional[Dict[int, Tuple[Optional[int], int, bool, Optional[str]]]] = None
+        self._title_summary_folded: Optional[Dict[int, Tuple[str, ...]]] = None
+
+    def _ensure_cache(self, force_reload: bool = False) -> None:
         """
-        Get all meetings, with caching for performance.
+        Load all meetings into the cache if needed.
+
+        Tools work on positions into self._meetings_cache together with the
+        per-position arrays built from it, rather than on Meeting lists.
 
         Args:
             force_reload: Force reload from cache file
-
-        Returns:
-            List[Meeting]: All available meetings
         """
         if self._meetings_cache is None or force_reload:
             try:
@@ -56,110 +123,361 @@ class MCPTools:
                     self.parser.reload()
                 meeting_data = self.parser.get_meetings()
                 self._meetings_cache = [Meeting(data) for data in meeting_data]
+                self._build_indexes()
             except Exception as e:
                 raise MCPToolError(f"Failed to load meetings: {e}")
 
-        return self._meetings_cache
+    def _indices(self) -> range:
+        """Get the positions of every cached meeting."""
+        return range(len(self._meetings_cache))
+
+    def _build_indexes(self) -> None:
+        """
+        Build the ID index over the freshly loaded meetings cache and drop
+        every derived index.
+
+        Only the ID index is built eagerly, so single-meeting lookups never
+        pay for parsing every meeting; the time and participant indexes are
+        built on first use, and per-meeting result fields and folded search
+        texts on first use of each meeting.
+        """
+        # Index by ID; the first meeting wins on duplicate IDs, matching
+        # the order a linear scan would have found them in
+        self._meetings_by_id = {}
+        for meeting in self._meetings_cache:
+            self._meetings_by_id.setdefault(meeting.id, meeting)
+
+        self._start_times = None
+        self._start_iso = None
+        self._time_buckets = None
+        self._time_bucket_counts_memo = None
+        self._sorted_desc_positions = None
+        self._sorted_asc_keys = None
+        self._sorted_asc_positions = None
+        self._window_cache = None
+        self._participant_index = None
+        self._participant_keys = None
+        self._participants = None
+        self._participants_lower = None
+        self._durations_min = None
+        self._summary_fields = None
+        self._title_summary_folded = None
+
+    def _build_time_index(self) -> None:
+        """Precompute start times and the sorted-by-start-time views."""
+        self._start_times = [meeting.start_time for meeting in self._meetings_cache]
+        self._start_iso = [
+            start_time.isoformat() if start_time else None for start_time in self._start_times
+        ]
+
+        # Meetings without a start time are left out of the sorted views,
+        # and ties keep their cache order in both directions
+        dated = [
+            (start_time, position)
+            for position, start_time in enumerate(self._start_times)
+            if start_time
+        ]
+
+        self._sorted_desc_positions = [
+            position for _, position in sorted(dated, key=lambda item: item[0], reverse=True)
+        ]
+
+        dated.sort(key=lambda item: item[0])
+        self._sorted_asc_keys = [start_time for start_time, _ in dated]
+        self._sorted_asc_positions = [position for _, position in dated]
+
+        # Date windows over the sorted view, keyed by their bisect bounds
+        self._window_cache = OrderedDict()
+
+    def _build_time_buckets(self) -> None:
+        """
+        Precompute the calendar buckets of every meeting's start time:
+        (day, week start, month, hour, weekday), or None without a start time.
+        """
+        if self._start_times is None:
+            self._build_time_index()
+
+        self._time_buckets = []
+        for start_time in self._start_times:
+            if not start_time:
+                self._time_buckets.append(None)
+                continue
+            date = start_time.date()
+            self._time_buckets.append((
+                date.isoformat(),
+                (date - datetime.timedelta(days=date.weekday())).isoformat(),
+                f"{date.year}-{date.month:02d}",
+                start_time.hour,
+                date.weekday()
+            ))
+
+    def _time_bucket_counts(self, positions: Sequence[int]) -> Tuple[Counter, ...]:
+        """
+        Count meetings per day, week, month, hour and weekday in a single pass.
+
+        The counts of the last set of positions are kept, so frequency and
+        pattern statistics over the same date range share one pass.
+        Callers must not modify the returned counters.
+        """
+        if self._time_buckets is None:
+            self._build_time_buckets()
+
+        key = tuple(positions)
+        memo = self._time_bucket_counts_memo
+        if memo is not None and memo[0] == key:
+            return memo[1]
+
+        counts = (Counter(), Counter(), Counter(), Counter(), Counter())
+        daily, weekly, monthly, hourly, weekdays = counts
+        time_buckets = self._time_buckets
+        for position in key:
+            buckets = time_buckets[position]
+            if buckets is None:
+                continue
+            day, week, month, hour, weekday = buckets
+            daily[day] += 1
+            weekly[week] += 1
+            monthly[month] += 1
+            hourly[hour] += 1
+            weekdays[weekday] += 1
 
-    def _filter_meetings_by_date(self, meetings: List[Meeting],
-                                from_date: Optional[str] = None,
-                                to_date: Optional[str] = None) -> List[Meeting]:
+        self._time_bucket_counts_memo = (key, counts)
+        return counts
+
+    def _build_participant_index(self) -> None:
+        """
+        Read and lowercase every meeting's participants once, and build the
+        inverted index: lowercased participant -> cache positions.
+        """
+        self._participants = [tuple(meeting.participants) for meeting in self._meetings_cache]
+        self._participants_lower = [
+            tuple(participant.lower() for participant in participants)
+            for participants in self._participants
+        ]
+
+        participant_index = defaultdict(list)
+        for position, participants_lower in enumerate(self._participants_lower):
+            for participant_lower in participants_lower:
+                postings = participant_index[participant_lower]
+                if not postings or postings[-1] != position:
+                    postings.append(position)
+
+        self._participant_index = dict(participant_index)
+        self._participant_keys = list(self._participant_index)
+
+    def _duration_min(self, position: int) -> Optional[float]:
         """
-        Filter meetings by date range.
+        Get the duration in minutes of the meeting at a cache position (None
+        when unknown or zero), computed on first use of that meeting.
+        """
+        if self._durations_min is None:
+            self._durations_min = {}
+
+        if position not in self._durations_min:
+            duration = self._meetings_cache[position].duration
+            self._durations_min[position] = duration.total_seconds() / 60 if duration else None
+        return self._durations_min[position]
+
+    def _summary_fields_at(self, position: int) -> Tuple[Optional[int], int, bool, Optional[str]]:
+        """
+        Get the duration, participant count, transcript flag and truncated
+        summary of the meeting at a cache position, computed on first use of
+        that meeting so formatting a few results never parses the whole cache.
+        """
+        if self._summary_fields is None:
+            self._summary_fields = {}
+
+        fields = self._summary_fields.get(position)
+        if fields is None:
+            meeting = self._meetings_cache[position]
+            duration = self._duration_min(position)
+            summary = meeting.summary
+            if summary and len(summary) > 200:
+                summary = summary[:200] + "..."
+            fields = (
+                int(duration) if duration is not None else None,
+                len(meeting.participants),
+                meeting.has_transcript(),
+                summary
+            )
+            self._summary_fields[position] = fields
+        return fields
+
+    def _title_summary_texts(self, position: int) -> Tuple[str, ...]:
+        """
+        Get the case-folded title and summary of a meeting, computed on first
+        search of that meeting.
+
+        Transcripts are not copied here: their full text is already cached by
+        Transcript, and folding it per query keeps memory flat.
+        """
+        if self._title_summary_folded is None:
+            self._title_summary_folded = {}
+
+        texts = self._title_summary_folded.get(position)
+        if texts is None:
+            meeting = self._meetings_cache[position]
+            texts = tuple(text.casefold() for text in (meeting.title, meeting.summary) if text)
+            self._title_summary_folded[position] = texts
+        return texts
+
+    def _text_matches(self, position: int, query_folded: str) -> bool:
+        """Check a case-folded query against the title, summary and transcript of a meeting."""
+        if any(query_folded in text for text in self._title_summary_texts(position)):
+            return True
+
+        meeting = self._meetings_cache[position]
+        if meeting.has_transcript() and meeting.transcript:
+            return query_folded in meeting.transcript.full_text.casefold()
+        return False
+
+    def _durations_for(self, positions: Sequence[int]) -> List[float]:
+        """Get the durations in minutes of the meetings that have one."""
+        duration_min = self._duration_min
+        return [
+            duration for duration in (duration_min(position) for position in positions)
+            if duration is not None
+        ]
+
+    def _start_times_for(self, positions: Sequence[int]) -> List[datetime.datetime]:
+        """Get the precomputed start times of the meetings that have one."""
+        if self._start_times is None:
+            self._build_time_index()
+
+        start_times = self._start_times
+        return [
+            start_time for start_time in (start_times[position] for position in positions)
+            if start_time
+        ]
+
+    def _participants_for(self, positions: Sequence[int]) -> List[Tuple[str, ...]]:
+        """Get the precomputed participants of each meeting."""
+        if self._participants is None:
+            self._build_participant_index()
+
+        participants = self._participants
+        return [participants[position] for position in positions]
+
+    def _format_meeting_summary(self, position: int) -> Dict[str, Any]:
+        """Build the standard result entry for the meeting at a cache position."""
+        if self._start_iso is None:
+            self._build_time_index()
+
+        meeting = self._meetings_cache[position]
+        duration_minutes, participant_count, has_transcript, summary = self._summary_fields_at(position)
+        return {
+            "id": meeting.id,
+            "title": meeting.title,
+            "start_time": self._start_iso[position],
+            "duration_minutes": duration_minutes,
+            "participant_count": participant_count,
+            "has_transcript": has_transcript,
+            "summary": summary
+        }
+
+    def _resolve_date_range(self, from_date: Optional[str],
+                            to_date: Optional[str]) -> Tuple[datetime.datetime, datetime.datetime]:
+        """
+        Resolve date filter strings into an inclusive datetime range.
 
         Args:
-            meetings: List of meetings to filter
             from_date: Start date (ISO format or relative like '30d')
             to_date: End date (ISO format or relative like '1d')
 
         Returns:
-            List[Meeting]: Filtered meetings
+            Tuple of start and end datetimes in CST
         """
-        if not from_date and not to_date:
-            return meetings
-
         try:
-            cst_tz = get_cst_timezone()
-            
             if from_date and to_date:
-                start_date, end_date = get_date_range(from_date, to_date)
+                return get_date_range(from_date, to_date)
             elif from_date:
-                start_date = parse_date(from_date)
-                end_date = datetime.datetime.now(cst_tz)
+                return parse_date(from_date), datetime.datetime.now(_CST_TZ)
             else:
                 # Only to_date specified
-                if to_date:
-                    end_date = parse_date(to_date)
-                    start_date = datetime.datetime.min.replace(tzinfo=cst_tz)
-                else:
-                    return meetings
-
-            filtered_meetings = []
-            for meeting in meetings:
-                if meeting.start_time and start_date <= meeting.start_time <= end_date:
-                    filtered_meetings.append(meeting)
-
-            return filtered_meetings
+                return _MIN_DT_CST, parse_date(to_date)
 
         except ValueError as e:
             raise MCPToolError(f"Invalid date format: {e}")
 
-    def _filter_meetings_by_participant(self, meetings: List[Meeting],
-                                      participant: str) -> List[Meeting]:
+    def _positions_in_range(self, start_date: datetime.datetime,
+                            end_date: datetime.datetime) -> Tuple[int, ...]:
+        """
+        Get the cache positions of meetings starting within a range, in cache order.
+
+        Windows are cached by their bounds in the sorted view, so repeated
+        filters resolving to the same meetings (such as a relative '30d' a
+        few minutes apart) reuse it; the cache is dropped on reload.
+        """
+        if self._sorted_asc_keys is None:
+            self._build_time_index()
+
+        lo = bisect.bisect_left(self._sorted_asc_keys, start_date)
+        hi = bisect.bisect_right(self._sorted_asc_keys, end_date)
+
+        key = (lo, hi)
+        window = self._window_cache.get(key)
+        if window is not None:
+            self._window_cache.move_to_end(key)
+            return window
+
+        # Slice the window out of the sorted view, then restore cache order
+        window = tuple(sorted(self._sorted_asc_positions[lo:hi]))
+        self._window_cache[key] = window
+        if len(self._window_cache) > _WINDOW_CACHE_SIZE:
+            self._window_cache.popitem(last=False)
+        return window
+
+    def _filter_meetings_by_date(self, from_date: Optional[str] = None,
+                                to_date: Optional[str] = None) -> Sequence[int]:
         """
-        Filter meetings by participant.
+        Filter the cached meetings by date range.
 
         Args:
-            meetings: List of meetings to filter
-            participant: Participant email or name to filter by
+            from_date: Start date (ISO format or relative like '30d')
+            to_date: End date (ISO format or relative like '1d')
 
         Returns:
-            List[Meeting]: Meetings with the specified participant
+            Sequence[int]: Positions of the meetings in range, in cache order
         """
-        filtered_meetings = []
-        participant_lower = participant.lower()
-
-        for meeting in meetings:
-            for p in meeting.participants:
-                if participant_lower in p.lower():
-                    filtered_meetings.append(meeting)
-                    break
+        if not from_date and not to_date:
+            return self._indices()
 
-        return filtered_meetings
+        start_date, end_date = self._resolve_date_range(from_date, to_date)
+        return self._positions_in_range(start_date, end_date)
 
-    def _search_meetings_by_query(self, meetings: List[Meeting],
-                                query: str) -> List[Meeting]:
+    def _participant_positions(self, participant: str,
+                               positions: Optional[Sequence[int]] = None) -> Set[int]:
         """
-        Search meetings by text query in title and content.
+        Get the cache positions of meetings with a matching participant.
 
         Args:
-            meetings: List of meetings to search
-            query: Search query
+            participant: Participant email or name (case-insensitive substring)
+            positions: Optional candidate positions the caller will restrict to
 
         Returns:
-            List[Meeting]: Meetings matching the query
+            Set[int]: Positions of meetings with the specified participant
         """
-        matching_meetings = []
-        query_lower = query.lower()
+        if self._participant_index is None:
+            self._build_participant_index()
 
-        for meeting in meetings:
-            # Search in title
-            if meeting.title and query_lower in meeting.title.lower():
-                matching_meetings.append(meeting)
-                continue
+        participant_lower = participant.lower()
 
-            # Search in summary
-            if meeting.summary and query_lower in meeting.summary.lower():
-                matching_meetings.append(meeting)
-                continue
+        # With fewer candidates than distinct names, checking the candidates'
+        # lowercased participants directly is cheaper than the index
+        if positions is not None and len(positions) < len(self._participant_keys):
+            return {
+                position for position in positions
+                if any(participant_lower in name for name in self._participants_lower[position])
+            }
 
-            # Search in transcript
-            if meeting.has_transcript() and meeting.transcript:
-                if query_lower in meeting.transcript.full_text.lower():
-                    matching_meetings.append(meeting)
-                    continue
+        # Substring-match against the distinct participant names only, then
+        # union their postings
+        hits = set()
+        for key in self._participant_keys:
+            if participant_lower in key:
+                hits.update(self._participant_index[key])
 
-        return matching_meetings
+        return hits
 
     def refresh_cache(self) -> Dict[str, Any]:
         """
@@ -174,14 +492,15 @@ class MCPTools:
         try:
             # Force reload the cache
             old_count = len(self._meetings_cache) if self._meetings_cache else 0
-            meetings = self._get_meetings(force_reload=True)
-            new_count = len(meetings)
+            self._ensure_cache(force_reload=True)
+            new_count = len(self._meetings_cache)
 
             # Find the most recent meeting date
-            meetings_with_dates = [m for m in meetings if m.start_time]
+            if self._sorted_desc_positions is None:
+                self._build_time_index()
+            meetings_with_dates = self._sorted_desc_positions
             if meetings_with_dates:
-                meetings_with_dates.sort(key=lambda m: m.start_time, reverse=True)
-                latest_meeting = meetings_with_dates[0]
+                latest_meeting = self._meetings_cache[meetings_with_dates[0]]
                 latest_date = latest_meeting.start_time.isoformat()
             else:
                 latest_date = None
@@ -209,28 +528,16 @@ class MCPTools:
             Dict containing the most recent meetings
         """
         try:
-            meetings = self._get_meetings()
+            self._ensure_cache()
 
-            # Sort all meetings by start time (most recent first)
-            meetings_with_dates = [m for m in meetings if m.start_time]
-            meetings_with_dates.sort(key=lambda m: m.start_time, reverse=True)
+            # Take the requested number of most recent meetings from the
+            # pre-sorted view (most recent first)
+            if self._sorted_desc_positions is None:
+                self._build_time_index()
+            recent_positions = self._sorted_desc_positions[:count]
 
-            # Take the requested number of most recent meetings
-            recent_meetings = meetings_with_dates[:count]
-
-            # Format results (reuse the same format as search_meetings)
-            results = []
-            for meeting in recent_meetings:
-                result = {
-                    "id": meeting.id,
-                    "title": meeting.title,
-                    "start_time": meeting.start_time.isoformat() if meeting.start_time else None,
-                    "duration_minutes": int(meeting.duration.total_seconds() / 60) if meeting.duration else None,
-                    "participant_count": len(meeting.participants),
-                    "has_transcript": meeting.has_transcript(),
-                    "summary": meeting.summary[:200] + "..." if meeting.summary and len(meeting.summary) > 200 else meeting.summary
-                }
-                results.append(result)
+            # Format results (same format as search_meetings)
+            results = [self._format_meeting_summary(position) for position in recent_positions]
 
             return {
                 "total_found": len(results),
@@ -238,7 +545,7 @@ class MCPTools:
                 "filters_applied": {
                     "type": "recent_meetings",
                     "count_requested": count,
-                    "total_meetings_in_cache": len(meetings)
+                    "total_meetings_in_cache": len(self._meetings_cache)
                 }
             }
 
@@ -286,39 +593,32 @@ class MCPTools:
             Dict containing search results
         """
         try:
-            meetings = self._get_meetings()
+            self._ensure_cache()
 
             # Apply default 3-day lookback if no date filters specified
             if not from_date and not to_date:
                 from_date = "3d"
 
-            # Apply filters
-            if from_date or to_date:
-                meetings = self._filter_meetings_by_date(meetings, from_date, to_date)
-
-            if participant:
-                meetings = self._filter_meetings_by_participant(meetings, participant)
+            start_date, end_date = self._resolve_date_range(from_date, to_date)
+            window = self._positions_in_range(start_date, end_date)
+            participant_hits = self._participant_positions(participant, window) if participant else None
+            # Case-fold the query once; the texts it is matched against are folded too
+            query_folded = query.casefold() if query else None
+            max_results = limit if limit and limit > 0 else None
 
-            if query:
-                meetings = self._search_meetings_by_query(meetings, query)
+            # Apply the date, participant and query filters in a single pass
+            # over the date window, stopping as soon as the limit is reached
+            results = []
+            for position in window:
+                if participant_hits is not None and position not in participant_hits:
+                    continue
 
-            # Apply limit
-            if limit and limit > 0:
-                meetings = meetings[:limit]
+                if query_folded is not None and not self._text_matches(position, query_folded):
+                    continue
 
-            # Format results
-            results = []
-            for meeting in meetings:
-                result = {
-                    "id": meeting.id,
-                    "title": meeting.title,
-                    "start_time": meeting.start_time.isoformat() if meeting.start_time else None,
-                    "duration_minutes": int(meeting.duration.total_seconds() / 60) if meeting.duration else None,
-                    "participant_count": len(meeting.participants),
-                    "has_transcript": meeting.has_transcript(),
-                    "summary": meeting.summary[:200] + "..." if meeting.summary and len(meeting.summary) > 200 else meeting.summary
-                }
-                results.append(result)
+                results.append(self._format_meeting_summary(position))
+                if max_results is not None and len(results) >= max_results:
+                    break
 
             return {
                 "total_found": len(results),
@@ -346,14 +646,10 @@ class MCPTools:
             Dict containing complete meeting details
         """
         try:
-            meetings = self._get_meetings()
+            self._ensure_cache()
 
             # Find the meeting
-            meeting = None
-            for m in meetings:
-                if m.id == meeting_id:
-                    meeting = m
-                    break
+            meeting = self._meetings_by_id.get(meeting_id)
 
             if not meeting:
                 raise MCPToolError(f"Meeting not found: {meeting_id}")
@@ -364,7 +660,7 @@ class MCPTools:
                 "title": meeting.title,
                 "start_time": meeting.start_time.isoformat() if meeting.start_time else None,
                 "end_time": meeting.end_time.isoformat() if meeting.end_time else None,
-                "duration_minutes": int(meeting.duration.total_seconds() / 60) if meeting.duration else None,
+                "duration_minutes": meeting.duration_minutes,
                 "participants": meeting.participants,
                 "summary": meeting.summary,
                 "tags": meeting.tags,
@@ -403,14 +699,10 @@ class MCPTools:
             Dict containing transcript data
         """
         try:
-            meetings = self._get_meetings()
+            self._ensure_cache()
 
             # Find the meeting
-            meeting = None
-            for m in meetings:
-                if m.id == meeting_id:
-                    meeting = m
-                    break
+            meeting = self._meetings_by_id.get(meeting_id)
 
             if not meeting:
                 raise MCPToolError(f"Meeting not found: {meeting_id}")
@@ -470,14 +762,10 @@ class MCPTools:
             Dict containing meeting notes and summary
         """
         try:
-            meetings = self._get_meetings()
+            self._ensure_cache()
 
             # Find the meeting
-            meeting = None
-            for m in meetings:
-                if m.id == meeting_id:
-                    meeting = m
-                    break
+            meeting = self._meetings_by_id.get(meeting_id)
 
             if not meeting:
                 raise MCPToolError(f"Meeting not found: {meeting_id}")
@@ -486,7 +774,7 @@ class MCPTools:
                 "meeting_id": meeting_id,
                 "title": meeting.title,
                 "date": meeting.start_time.strftime("%Y-%m-%d") if meeting.start_time else None,
-                "duration": f"{int(meeting.duration.total_seconds() / 60)} minutes" if meeting.duration else None,
+                "duration": f"{meeting.duration_minutes} minutes" if meeting.duration_minutes is not None else None,
                 "participants": meeting.participants,
                 "summary": meeting.summary,
                 "tags": meeting.tags
@@ -508,10 +796,13 @@ class MCPTools:
 
                 # Speaker participation analysis
                 if len(transcript.segments) > 0:
-                    speaker_words = defaultdict(int)
+                    # Read each segment's speaker/text property only once
+                    speaker_words = Counter()
                     for segment in transcript.segments:
-                        if segment.speaker and segment.text:
-                            speaker_words[segment.speaker] += len(segment.text.split())
+                        speaker = segment.speaker
+                        text = segment.text
+                        if speaker and text:
+                            speaker_words[speaker] += len(text.split())
 
                     if speaker_words:
                         result["transcript_summary"]["speaker_participation"] = dict(speaker_words)
@@ -538,41 +829,55 @@ class MCPTools:
             Dict containing participant list and statistics
         """
         try:
-            meetings = self._get_meetings()
-
-            # Apply date filters
-            if from_date or to_date:
-                meetings = self._filter_meetings_by_date(meetings, from_date, to_date)
+            self._ensure_cache()
+            positions = self._filter_meetings_by_date(from_date, to_date)
 
             # Count participant occurrences
+            participant_lists = self._participants_for(positions)
             participant_counts = Counter()
-            participant_meetings = defaultdict(list)
-
-            for meeting in meetings:
-                for participant in meeting.participants:
-                    participant_counts[participant] += 1
-                    participant_meetings[participant].append({
-                        "id": meeting.id,
-                        "title": meeting.title,
-                        "date": meeting.start_time.isoformat() if meeting.start_time else None
-                    })
-
-            # Apply minimum meetings filter
-            if min_meetings:
-                participant_counts = Counter({p: c for p, c in participant_counts.items() if c >= min_meetings})
-
-            # Build results
+            participant_counts.update(chain.from_iterable(participant_lists))
+
+            # Record which meetings each participant attended as indices;
+            # the meeting entries are only built for participants returned
+            participant_indices = defaultdict(list)
+            for index, meeting_participants in enumerate(participant_lists):
+                for participant in meeting_participants:
+                    participant_indices[participant].append(index)
+
+            if self._start_iso is None:
+                self._build_time_index()
+
+            # Build results; most_common() yields descending counts, so the
+            # minimum meetings filter can stop at the first entry below it
             participants = []
+            meeting_briefs: Dict[int, Dict[str, Any]] = {}
             for participant, count in participant_counts.most_common():
+                if min_meetings and count < min_meetings:
+                    break
+
+                # Each meeting's entry is built once and shared between its participants
+                participant_meetings = []
+                for index in participant_indices[participant]:
+                    meeting_brief = meeting_briefs.get(index)
+                    if meeting_brief is None:
+                        position = positions[index]
+                        meeting = self._meetings_cache[position]
+                        meeting_brief = meeting_briefs[index] = {
+                            "id": meeting.id,
+                            "title": meeting.title,
+                            "date": self._start_iso[position]
+                        }
+                    participant_meetings.append(meeting_brief)
+
                 participants.append({
                     "name": participant,
                     "meeting_count": count,
-                    "meetings": participant_meetings[participant]
+                    "meetings": participant_meetings
                 })
 
             return {
                 "total_participants": len(participants),
-                "total_meetings_analyzed": len(meetings),
+                "total_meetings_analyzed": len(positions),
                 "participants": participants,
                 "filters_applied": {
                     "from_date": from_date,
@@ -599,22 +904,19 @@ class MCPTools:
             Dict containing statistical analysis
         """
         try:
-            meetings = self._get_meetings()
-
-            # Apply date filters
-            if from_date or to_date:
-                meetings = self._filter_meetings_by_date(meetings, from_date, to_date)
+            self._ensure_cache()
+            positions = self._filter_meetings_by_date(from_date, to_date)
 
             if stat_type == "summary":
-                return self._get_summary_statistics(meetings)
+                return self._get_summary_statistics(positions)
             elif stat_type == "frequency":
-                return self._get_frequency_statistics(meetings)
+                return self._get_frequency_statistics(positions)
             elif stat_type == "duration":
-                return self._get_duration_statistics(meetings)
+                return self._get_duration_statistics(positions)
             elif stat_type == "participants":
-                return self._get_participant_statistics(meetings)
+                return self._get_participant_statistics(positions)
             elif stat_type == "patterns":
-                return self._get_pattern_statistics(meetings)
+                return self._get_pattern_statistics(positions)
             else:
                 raise MCPToolError(f"Unknown statistics type: {stat_type}")
 
@@ -623,15 +925,18 @@ class MCPTools:
         except Exception as e:
             raise MCPToolError(f"Failed to generate statistics: {e}")
 
-    def _get_summary_statistics(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _get_summary_statistics(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Generate summary statistics."""
-        total_meetings = len(meetings)
-        meetings_with_dates = len([m for m in meetings if m.start_time])
-        meetings_with_durations = len([m for m in meetings if m.duration])
-        meetings_with_transcripts = len([m for m in meetings if m.has_transcript()])
+        total_meetings = len(positions)
+        durations = self._durations_for(positions)
+        dates = self._start_times_for(positions)
+        meetings_with_dates = len(dates)
+        meetings_with_durations = len(durations)
+        meetings_with_transcripts = sum(
+            self._meetings_cache[position].has_transcript() for position in positions
+        )
 
         # Date range
-        dates = [m.start_time for m in meetings if m.start_time]
         date_range = None
         if dates:
             earliest = min(dates)
@@ -643,12 +948,11 @@ class MCPTools:
             }
 
         # Duration statistics
-        durations = [m.duration.total_seconds() / 60 for m in meetings if m.duration]
         duration_stats = None
         if durations:
             duration_stats = {
                 "total_minutes": sum(durations),
-                "average_minutes": statistics.mean(durations),
+                "average_minutes": statistics.fmean(durations),
                 "median_minutes": statistics.median(durations),
                 "min_minutes": min(durations),
                 "max_minutes": max(durations)
@@ -657,8 +961,7 @@ class MCPTools:
         # Participant statistics
         all_participants = set()
         total_participations = 0
-        for meeting in meetings:
-            participants = meeting.participants
+        for participants in self._participants_for(positions):
             all_participants.update(participants)
             total_participations += len(participants)
 
@@ -676,28 +979,9 @@ class MCPTools:
             }
         }
 
-    def _get_frequency_statistics(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _get_frequency_statistics(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Generate frequency statistics."""
-        # Daily frequency
-        daily_counts = defaultdict(int)
-        for meeting in meetings:
-            if meeting.start_time:
-                date_key = meeting.start_time.date().isoformat()
-                daily_counts[date_key] += 1
-
-        # Weekly frequency
-        weekly_counts = defaultdict(int)
-        for meeting in meetings:
-            if meeting.start_time:
-                monday = meeting.start_time.date() - datetime.timedelta(days=meeting.start_time.weekday())
-                weekly_counts[monday.isoformat()] += 1
-
-        # Monthly frequency
-        monthly_counts = defaultdict(int)
-        for meeting in meetings:
-            if meeting.start_time:
-                month_key = f"{meeting.start_time.year}-{meeting.start_time.month:02d}"
-                monthly_counts[month_key] += 1
+        daily_counts, weekly_counts, monthly_counts, _, _ = self._time_bucket_counts(positions)
 
         return {
             "daily_frequency": dict(daily_counts),
@@ -708,38 +992,20 @@ class MCPTools:
             "peak_month": max(monthly_counts.items(), key=lambda x: x[1]) if monthly_counts else None
         }
 
-    def _get_duration_statistics(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _get_duration_statistics(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Generate duration statistics."""
-        durations = [m.duration.total_seconds() / 60 for m in meetings if m.duration]
+        durations = self._durations_for(positions)
 
         if not durations:
             return {"error": "No duration data available"}
 
         # Duration distribution
-        duration_ranges = {
-            "0-15 min": 0,
-            "15-30 min": 0,
-            "30-60 min": 0,
-            "60-90 min": 0,
-            "90+ min": 0
-        }
-
-        for duration in durations:
-            if duration <= 15:
-                duration_ranges["0-15 min"] += 1
-            elif duration <= 30:
-                duration_ranges["15-30 min"] += 1
-            elif duration <= 60:
-                duration_ranges["30-60 min"] += 1
-            elif duration <= 90:
-                duration_ranges["60-90 min"] += 1
-            else:
-                duration_ranges["90+ min"] += 1
+        duration_ranges = dict(zip(_DURATION_BUCKET_LABELS, _duration_histogram(durations)))
 
         return {
             "total_meetings": len(durations),
             "total_minutes": sum(durations),
-            "average_minutes": statistics.mean(durations),
+            "average_minutes": statistics.fmean(durations),
             "median_minutes": statistics.median(durations),
             "min_minutes": min(durations),
             "max_minutes": max(durations),
@@ -747,16 +1013,12 @@ class MCPTools:
             "duration_distribution": duration_ranges
         }
 
-    def _get_participant_statistics(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _get_participant_statistics(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Generate participant statistics."""
+        participant_lists = self._participants_for(positions)
         participant_counts = Counter()
-        meeting_sizes = []
-
-        for meeting in meetings:
-            participants = meeting.participants
-            meeting_sizes.append(len(participants))
-            for participant in participants:
-                participant_counts[participant] += 1
+        participant_counts.update(chain.from_iterable(participant_lists))
+        meeting_sizes = [len(participants) for participants in participant_lists]
 
         if not participant_counts:
             return {"error": "No participant data available"}
@@ -772,17 +1034,9 @@ class MCPTools:
             "meeting_size_distribution": dict(Counter(meeting_sizes))
         }
 
-    def _get_pattern_statistics(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _get_pattern_statistics(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Generate time pattern statistics."""
-        hourly_counts = defaultdict(int)
-        daily_counts = defaultdict(int)  # 0=Monday, 6=Sunday
-
-        for meeting in meetings:
-            if meeting.start_time:
-                hour = meeting.start_time.hour
-                day_of_week = meeting.start_time.weekday()
-                hourly_counts[hour] += 1
-                daily_counts[day_of_week] += 1
+        _, _, _, hourly_counts, daily_counts = self._time_bucket_counts(positions)  # 0=Monday, 6=Sunday
 
         # Convert to readable format
         day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
@@ -810,14 +1064,10 @@ class MCPTools:
             Dict containing markdown content
         """
         try:
-            meetings = self._get_meetings()
+            self._ensure_cache()
 
             # Find the meeting
-            meeting = None
-            for m in meetings:
-                if m.id == meeting_id:
-                    meeting = m
-                    break
+            meeting = self._meetings_by_id.get(meeting_id)
 
             if not meeting:
                 raise MCPToolError(f"Meeting not found: {meeting_id}")
@@ -858,20 +1108,17 @@ class MCPTools:
             Dict containing pattern analysis
         """
         try:
-            meetings = self._get_meetings()
-
-            # Apply date filters
-            if from_date or to_date:
-                meetings = self._filter_meetings_by_date(meetings, from_date, to_date)
+            self._ensure_cache()
+            positions = self._filter_meetings_by_date(from_date, to_date)
 
             if pattern_type == "time":
-                return self._analyze_time_patterns(meetings)
+                return self._analyze_time_patterns(positions)
             elif pattern_type == "frequency":
-                return self._analyze_frequency_patterns(meetings)
+                return self._analyze_frequency_patterns(positions)
             elif pattern_type == "participants":
-                return self._analyze_participant_patterns(meetings)
+                return self._analyze_participant_patterns(positions)
             elif pattern_type == "duration":
-                return self._analyze_duration_patterns(meetings)
+                return self._analyze_duration_patterns(positions)
             else:
                 raise MCPToolError(f"Unknown pattern type: {pattern_type}")
 
@@ -880,70 +1127,88 @@ class MCPTools:
         except Exception as e:
             raise MCPToolError(f"Failed to analyze patterns: {e}")
 
-    def _analyze_time_patterns(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _analyze_time_patterns(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Analyze time-based patterns."""
-        return self._get_pattern_statistics(meetings)
+        return self._get_pattern_statistics(positions)
 
-    def _analyze_frequency_patterns(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _analyze_frequency_patterns(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Analyze frequency patterns."""
-        return self._get_frequency_statistics(meetings)
+        return self._get_frequency_statistics(positions)
 
-    def _analyze_participant_patterns(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _analyze_participant_patterns(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Analyze participant patterns."""
-        # Find frequent collaborations
+        # Find frequent collaborations; only meetings with at least two
+        # participants have any pairs
+        multi = [
+            participants for participants in self._participants_for(positions)
+            if len(participants) >= 2
+        ]
+
+        # Count all pairs of participants in one update, each keyed in sorted
+        # order; pairs are counted in meeting order so ties rank as before
         participant_pairs = Counter()
-
-        for meeting in meetings:
-            participants = meeting.participants
-            if len(participants) >= 2:
-                # Count all pairs of participants
-                for i, p1 in enumerate(participants):
-                    for p2 in participants[i+1:]:
-                        pair = tuple(sorted([p1, p2]))
-                        participant_pairs[pair] += 1
+        participant_pairs.update(
+            (p1, p2) if p1 <= p2 else (p2, p1)
+            for participants in multi
+            for p1, p2 in combinations(participants, 2)
+        )
 
         # Get participant statistics
-        participant_stats = self._get_participant_statistics(meetings)
+        participant_stats = self._get_participant_statistics(positions)
+
+        # The most frequent pair heads the top ten, so rank the pairs once
+        frequent_collaborations = participant_pairs.most_common(10)
 
         return {
             **participant_stats,
-            "frequent_collaborations": participant_pairs.most_common(10),
+            "frequent_collaborations": frequent_collaborations,
             "collaboration_analysis": {
                 "total_unique_pairs": len(participant_pairs),
-                "most_frequent_pair": participant_pairs.most_common(1)[0] if participant_pairs else None
+                "most_frequent_pair": frequent_collaborations[0] if frequent_collaborations else None
             }
         }
 
-    def _analyze_duration_patterns(self, meetings: List[Meeting]) -> Dict[str, Any]:
+    def _analyze_duration_patterns(self, positions: Sequence[int]) -> Dict[str, Any]:
         """Analyze duration patterns."""
-        duration_stats = self._get_duration_statistics(meetings)
+        duration_stats = self._get_duration_statistics(positions)
 
         # Add trend analysis if we have enough data
-        if len(meetings) > 5:
-            # Sort meetings by date
-            dated_meetings = [m for m in meetings if m.start_time and m.duration]
-            dated_meetings.sort(key=lambda m: m.start_time or datetime.datetime.min)
+        if len(positions) > 5:
+            if self._start_times is None:
+                self._build_time_index()
+            start_times = self._start_times
+            durations_min = {position: self._duration_min(position) for position in positions}
 
-            if len(dated_meetings) > 2:
-                # Simple trend analysis
-                durations = [m.duration.total_seconds() / 60 for m in dated_meetings if m.duration]
-                first_half = durations[:len(durations)//2]
-                second_half = durations[len(durations)//2:]
+            # Sort meetings by date
+            dated_meetings = [
+                position for position in positions
+                if start_times[position] and durations_min[position] is not None
+            ]
+            # Every position left has a start time, so sort on it directly
+            dated_meetings.sort(key=start_times.__getitem__)
+
+            n = len(dated_meetings)
+            if n > 2:
+                # Simple trend analysis; with more than two meetings both
+                # halves are non-empty, and each average is computed once
+                mid = n // 2
+                first_avg = statistics.fmean(
+                    durations_min[position] for position in islice(dated_meetings, mid)
+                )
+                second_avg = statistics.fmean(
+                    durations_min[position] for position in islice(dated_meetings, mid, n)
+                )
 
                 trend = "stable"
-                if len(first_half) > 0 and len(second_half) > 0:
-                    first_avg = statistics.mean(first_half)
-                    second_avg = statistics.mean(second_half)
-
-                    if second_avg > first_avg * 1.1:
-                        trend = "increasing"
-                    elif second_avg < first_avg * 0.9:
-                        trend = "decreasing"
+                if second_avg > first_avg * 1.1:
+                    trend = "increasing"
+                elif second_avg < first_avg * 0.9:
+                    trend = "decreasing"
 
                 duration_stats["trend_analysis"] = {
                     "trend": trend,
-                    "first_half_avg": statistics.mean(first_half) if first_half else 0,
-                    "second_half_avg": statistics.mean(second_half) if second_half else 0
+                    "first_half_avg": first_avg,
+                    "second_half_avg": second_avg
                 }
 
         return duration_stats
@@ -959,249 +1224,240 @@ class MCPTools:
         Returns:
             Dict containing tool execution results
         """
-        if tool_name == "get_recent_meetings":
-            return self.get_recent_meetings(**arguments)
-        elif tool_name == "list_meetings":
-            return self.list_meetings(**arguments)
-        elif tool_name == "search_meetings":
-            return self.search_meetings(**arguments)
-        elif tool_name == "get_meeting":
-            return self.get_meeting(**arguments)
-        elif tool_name == "get_transcript":
-            return self.get_transcript(**arguments)
-        elif tool_name == "get_meeting_notes":
-            return self.get_meeting_notes(**arguments)
-        elif tool_name == "list_participants":
-            return self.list_participants(**arguments)
-        elif tool_name == "get_statistics":
-            return self.get_statistics(**arguments)
-        elif tool_name == "export_meeting":
-            return self.export_meeting(**arguments)
-        elif tool_name == "analyze_patterns":
-            return self.analyze_patterns(**arguments)
-        elif tool_name == "refresh_cache":
-            return self.refresh_cache()
-        else:
+        method_name = self._TOOL_DISPATCH.get(tool_name)
+        if method_name is None:
             raise MCPToolError(f"Unknown tool: {tool_name}")
 
+        method = getattr(self, method_name)
+        if tool_name in self._NO_ARGUMENT_TOOLS:
+            return method()
+        return method(**arguments)
+
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
         """
         Get MCP tool schemas for all available tools.
 
+        The schemas are static and shared between calls; callers must not
+        modify them.
+
         Returns:
             List of tool schema definitions
         """
-        return [
-            {
-                "name": "get_recent_meetings",
-                "description": "Get the most recent X meetings, sorted by date, going back as far as needed to find the requested number. Use this when you need exactly X recent meetings regardless of date range.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "count": {
-                            "type": "integer",
-                            "description": "Number of recent meetings to return (default: 10)",
-                            "minimum": 1,
-                            "maximum": 100
-                        }
-                    }
+        return _TOOL_SCHEMAS
+
+
+# MCP tool schemas, built once at import
+_TOOL_SCHEMAS: List[Dict[str, Any]] = [
+    {
+        "name": "get_recent_meetings",
+        "description": "Get the most recent X meetings, sorted by date, going back as far as needed to find the requested number. Use this when you need exactly X recent meetings regardless of date range.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "count": {
+                    "type": "integer",
+                    "description": "Number of recent meetings to return (default: 10)",
+                    "minimum": 1,
+                    "maximum": 100
                 }
-            },
-            {
-                "name": "list_meetings",
-                "description": "List recent meetings with optional date range filters. Defaults to last 3 days if no date filters specified. Use this tool to get a simple list of meetings without search criteria.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "from_date": {
-                            "type": "string",
-                            "description": "Start date (ISO format or relative like '30d', '1w', '3d') (optional, defaults to 3d if no date filters)"
-                        },
-                        "to_date": {
-                            "type": "string",
-                            "description": "End date (ISO format or relative like '1d') (optional)"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of results (optional)"
-                        }
-                    }
+            }
+        }
+    },
+    {
+        "name": "list_meetings",
+        "description": "List recent meetings with optional date range filters. Defaults to last 3 days if no date filters specified. Use this tool to get a simple list of meetings without search criteria.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_date": {
+                    "type": "string",
+                    "description": "Start date (ISO format or relative like '30d', '1w', '3d') (optional, defaults to 3d if no date filters)"
+                },
+                "to_date": {
+                    "type": "string",
+                    "description": "End date (ISO format or relative like '1d') (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
                 }
-            },
-            {
-                "name": "search_meetings",
-                "description": "Search meetings with flexible filters including text search, date range, and participant filters. Defaults to last 3 days if no date filters specified.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Text search in title/content (optional)"
-                        },
-                        "from_date": {
-                            "type": "string",
-                            "description": "Start date (ISO format or relative like '30d') (optional, defaults to 3d if no date filters)"
-                        },
-                        "to_date": {
-                            "type": "string",
-                            "description": "End date (ISO format or relative like '1d') (optional)"
-                        },
-                        "participant": {
-                            "type": "string",
-                            "description": "Filter by participant email/name (optional)"
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of results (optional)"
-                        }
-                    }
+            }
+        }
+    },
+    {
+        "name": "search_meetings",
+        "description": "Search meetings with flexible filters including text search, date range, and participant filters. Defaults to last 3 days if no date filters specified.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Text search in title/content (optional)"
+                },
+                "from_date": {
+                    "type": "string",
+                    "description": "Start date (ISO format or relative like '30d') (optional, defaults to 3d if no date filters)"
+                },
+                "to_date": {
+                    "type": "string",
+                    "description": "End date (ISO format or relative like '1d') (optional)"
+                },
+                "participant": {
+                    "type": "string",
+                    "description": "Filter by participant email/name (optional)"
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results (optional)"
                 }
-            },
-            {
-                "name": "get_meeting",
-                "description": "Get complete meeting details including metadata, participants, and transcript info",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "meeting_id": {
-                            "type": "string",
-                            "description": "Meeting ID to retrieve"
-                        }
-                    },
-                    "required": ["meeting_id"]
+            }
+        }
+    },
+    {
+        "name": "get_meeting",
+        "description": "Get complete meeting details including metadata, participants, and transcript info",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "meeting_id": {
+                    "type": "string",
+                    "description": "Meeting ID to retrieve"
                 }
             },
-            {
-                "name": "get_transcript",
-                "description": "Get full transcript for a specific meeting with optional speaker and timestamp information",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "meeting_id": {
-                            "type": "string",
-                            "description": "Meeting ID to retrieve transcript for"
-                        },
-                        "include_speakers": {
-                            "type": "boolean",
-                            "description": "Include speaker identification (default: true)"
-                        },
-                        "include_timestamps": {
-                            "type": "boolean",
-                            "description": "Include timestamps (default: false)"
-                        }
-                    },
-                    "required": ["meeting_id"]
+            "required": ["meeting_id"]
+        }
+    },
+    {
+        "name": "get_transcript",
+        "description": "Get full transcript for a specific meeting with optional speaker and timestamp information",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "meeting_id": {
+                    "type": "string",
+                    "description": "Meeting ID to retrieve transcript for"
+                },
+                "include_speakers": {
+                    "type": "boolean",
+                    "description": "Include speaker identification (default: true)"
+                },
+                "include_timestamps": {
+                    "type": "boolean",
+                    "description": "Include timestamps (default: false)"
                 }
             },
-            {
-                "name": "get_meeting_notes",
-                "description": "Get structured notes and summary for a meeting",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "meeting_id": {
-                            "type": "string",
-                            "description": "Meeting ID to get notes for"
-                        }
-                    },
-                    "required": ["meeting_id"]
+            "required": ["meeting_id"]
+        }
+    },
+    {
+        "name": "get_meeting_notes",
+        "description": "Get structured notes and summary for a meeting",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "meeting_id": {
+                    "type": "string",
+                    "description": "Meeting ID to get notes for"
                 }
             },
-            {
-                "name": "list_participants",
-                "description": "List all participants with frequency data and meeting history",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "from_date": {
-                            "type": "string",
-                            "description": "Start date filter (optional)"
-                        },
-                        "to_date": {
-                            "type": "string",
-                            "description": "End date filter (optional)"
-                        },
-                        "min_meetings": {
-                            "type": "integer",
-                            "description": "Minimum meeting count filter (optional)"
-                        }
-                    }
+            "required": ["meeting_id"]
+        }
+    },
+    {
+        "name": "list_participants",
+        "description": "List all participants with frequency data and meeting history",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_date": {
+                    "type": "string",
+                    "description": "Start date filter (optional)"
+                },
+                "to_date": {
+                    "type": "string",
+                    "description": "End date filter (optional)"
+                },
+                "min_meetings": {
+                    "type": "integer",
+                    "description": "Minimum meeting count filter (optional)"
                 }
-            },
-            {
-                "name": "get_statistics",
-                "description": "Generate meeting statistics and analytics",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "stat_type": {
-                            "type": "string",
-                            "description": "Type of statistics: summary, frequency, duration, participants, patterns",
-                            "enum": ["summary", "frequency", "duration", "participants", "patterns"]
-                        },
-                        "from_date": {
-                            "type": "string",
-                            "description": "Start date filter (optional)"
-                        },
-                        "to_date": {
-                            "type": "string",
-                            "description": "End date filter (optional)"
-                        }
-                    },
-                    "required": ["stat_type"]
+            }
+        }
+    },
+    {
+        "name": "get_statistics",
+        "description": "Generate meeting statistics and analytics",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "stat_type": {
+                    "type": "string",
+                    "description": "Type of statistics: summary, frequency, duration, participants, patterns",
+                    "enum": ["summary", "frequency", "duration", "participants", "patterns"]
+                },
+                "from_date": {
+                    "type": "string",
+                    "description": "Start date filter (optional)"
+                },
+                "to_date": {
+                    "type": "string",
+                    "description": "End date filter (optional)"
                 }
             },
-            {
-                "name": "export_meeting",
-                "description": "Export meeting in markdown format",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "meeting_id": {
-                            "type": "string",
-                            "description": "Meeting ID to export"
-                        },
-                        "include_transcript": {
-                            "type": "boolean",
-                            "description": "Include full transcript (default: true)"
-                        },
-                        "include_metadata": {
-                            "type": "boolean",
-                            "description": "Include meeting metadata (default: true)"
-                        }
-                    },
-                    "required": ["meeting_id"]
+            "required": ["stat_type"]
+        }
+    },
+    {
+        "name": "export_meeting",
+        "description": "Export meeting in markdown format",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "meeting_id": {
+                    "type": "string",
+                    "description": "Meeting ID to export"
+                },
+                "include_transcript": {
+                    "type": "boolean",
+                    "description": "Include full transcript (default: true)"
+                },
+                "include_metadata": {
+                    "type": "boolean",
+                    "description": "Include meeting metadata (default: true)"
                 }
             },
-            {
-                "name": "analyze_patterns",
-                "description": "Analyze meeting patterns and trends",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "pattern_type": {
-                            "type": "string",
-                            "description": "Type of pattern analysis: time, frequency, participants, duration",
-                            "enum": ["time", "frequency", "participants", "duration"]
-                        },
-                        "from_date": {
-                            "type": "string",
-                            "description": "Start date filter (optional)"
-                        },
-                        "to_date": {
-                            "type": "string",
-                            "description": "End date filter (optional)"
-                        }
-                    },
-                    "required": ["pattern_type"]
+            "required": ["meeting_id"]
+        }
+    },
+    {
+        "name": "analyze_patterns",
+        "description": "Analyze meeting patterns and trends",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "pattern_type": {
+                    "type": "string",
+                    "description": "Type of pattern analysis: time, frequency, participants, duration",
+                    "enum": ["time", "frequency", "participants", "duration"]
+                },
+                "from_date": {
+                    "type": "string",
+                    "description": "Start date filter (optional)"
+                },
+                "to_date": {
+                    "type": "string",
+                    "description": "End date filter (optional)"
                 }
             },
-            {
-                "name": "refresh_cache",
-                "description": "Force refresh the meetings cache from the Granola cache file. Use this when Granola has synced new meetings but they don't appear in queries. Returns the count of meetings before and after refresh.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {}
-                }
-            }
-        ]
\ No newline at end of file
+            "required": ["pattern_type"]
+        }
+    },
+    {
+        "name": "refresh_cache",
+        "description": "Force refresh the meetings cache from the Granola cache file. Use this when Granola has synced new meetings but they don't appear in queries. Returns the count of meetings before and after refresh.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    }
+]
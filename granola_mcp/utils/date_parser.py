@@ -7,10 +7,29 @@ Provides functions for parsing relative dates (3d, 24h, 1w) and absolute dates
 
 import datetime
 import re
+from functools import lru_cache
 from typing import Union, Tuple, Optional
 from ..core.timezone_utils import get_cst_timezone
 
 
+_CST_TZ = get_cst_timezone()
+
+# Date patterns, compiled once at import
+_REL_RE = re.compile(r'^(\d+)([hdwmy])$')
+_ALPHA_RE = re.compile(r'[a-zA-Z]')
+_ABS_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_ABS_DT_RE = re.compile(r'^(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})$')
+
+# Seconds per relative date unit
+_UNIT_SECS = {
+    'h': 3600,        # hours
+    'd': 86400,       # days
+    'w': 604800,      # weeks
+    'm': 30 * 86400,  # months (approximate as 30 days)
+    'y': 365 * 86400  # years (approximate as 365 days)
+}
+
+
 def parse_relative_date(relative_str: str, reference_time: Optional[datetime.datetime] = None) -> datetime.datetime:
     """
     Parse a relative date string like '3d', '24h', '1w' into a datetime.
@@ -26,14 +45,25 @@ def parse_relative_date(relative_str: str, reference_time: Optional[datetime.dat
         ValueError: If the relative date format is invalid
     """
     if reference_time is None:
-        reference_time = datetime.datetime.now(get_cst_timezone())
+        reference_time = datetime.datetime.now(_CST_TZ)
 
     # Normalize the input
     relative_str = relative_str.strip().lower()
 
+    # Subtract the delta to get the past time
+    return reference_time - _parse_relative_delta(relative_str)
+
+
+@lru_cache(maxsize=256)
+def _parse_relative_delta(relative_str: str) -> datetime.timedelta:
+    """
+    Parse a normalized relative date string into the timedelta it stands for.
+
+    The delta does not depend on the reference time, so it is memoized and
+    the reference time is subtracted exactly on every call.
+    """
     # Parse the relative date pattern
-    pattern = r'^(\d+)([hdwmy])$'
-    match = re.match(pattern, relative_str)
+    match = _REL_RE.match(relative_str)
 
     if not match:
         raise ValueError(f"Invalid relative date format: {relative_str}. Expected format like '3d', '24h', '1w'")
@@ -42,21 +72,11 @@ def parse_relative_date(relative_str: str, reference_time: Optional[datetime.dat
     unit = match.group(2)
 
     # Calculate the timedelta
-    if unit == 'h':  # hours
-        delta = datetime.timedelta(hours=amount)
-    elif unit == 'd':  # days
-        delta = datetime.timedelta(days=amount)
-    elif unit == 'w':  # weeks
-        delta = datetime.timedelta(weeks=amount)
-    elif unit == 'm':  # months (approximate as 30 days)
-        delta = datetime.timedelta(days=amount * 30)
-    elif unit == 'y':  # years (approximate as 365 days)
-        delta = datetime.timedelta(days=amount * 365)
-    else:
+    unit_seconds = _UNIT_SECS.get(unit)
+    if unit_seconds is None:
         raise ValueError(f"Unsupported time unit: {unit}")
 
-    # Subtract the delta to get the past time
-    return reference_time - delta
+    return datetime.timedelta(seconds=amount * unit_seconds)
 
 
 def parse_absolute_date(date_str: str, time_str: str = "00:00:00") -> datetime.datetime:
@@ -73,7 +93,20 @@ def parse_absolute_date(date_str: str, time_str: str = "00:00:00") -> datetime.d
     Raises:
         ValueError: If the date format is invalid
     """
+    return _parse_absolute_date(date_str, time_str)
+
+
+@lru_cache(maxsize=256)
+def _parse_absolute_date(date_str: str, time_str: str) -> datetime.datetime:
+    """Memoized implementation of parse_absolute_date(); the result is immutable."""
+    date_fields = _split_fixed_width(date_str, '-', (4, 2, 2))
+    time_fields = _split_fixed_width(time_str, ':', (2, 2, 2))
+
     try:
+        # Strict YYYY-MM-DD and HH:MM:SS (all parse_date() passes in) skip strptime
+        if date_fields and time_fields:
+            return datetime.datetime(*date_fields, *time_fields, tzinfo=_CST_TZ)
+
         # Parse the date
         date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
 
@@ -81,13 +114,30 @@ def parse_absolute_date(date_str: str, time_str: str = "00:00:00") -> datetime.d
         time_obj = datetime.datetime.strptime(time_str, "%H:%M:%S").time()
 
         # Combine date and time with CST timezone
-        cst_tz = get_cst_timezone()
-        return datetime.datetime.combine(date_obj, time_obj, tzinfo=cst_tz)
+        return datetime.datetime.combine(date_obj, time_obj, tzinfo=_CST_TZ)
 
     except ValueError as e:
         raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD") from e
 
 
+def _split_fixed_width(value: str, separator: str, widths: Tuple[int, ...]) -> Optional[Tuple[int, ...]]:
+    """
+    Split a fixed-width numeric string like '2025-01-01' or '09:30:00' into ints.
+
+    Returns None unless every field has exactly its width in ASCII digits, so
+    callers can fall back to strptime for anything looser.
+    """
+    fields = value.split(separator)
+    if len(fields) != len(widths) or not value.isascii():
+        return None
+
+    for field, width in zip(fields, widths):
+        if len(field) != width or not field.isdigit():
+            return None
+
+    return tuple(int(field) for field in fields)
+
+
 def parse_date(date_input: str, reference_time: Optional[datetime.datetime] = None) -> datetime.datetime:
     """
     Parse either a relative or absolute date string.
@@ -105,15 +155,15 @@ def parse_date(date_input: str, reference_time: Optional[datetime.datetime] = No
     date_input = date_input.strip()
 
     # Check if it's a relative date (contains letters)
-    if re.search(r'[a-zA-Z]', date_input):
+    if _ALPHA_RE.search(date_input):
         return parse_relative_date(date_input, reference_time)
 
     # Check if it's an absolute date (YYYY-MM-DD format)
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', date_input):
+    if _ABS_DATE_RE.match(date_input):
         return parse_absolute_date(date_input)
 
     # Check if it's an absolute datetime (YYYY-MM-DD HH:MM:SS format)
-    datetime_match = re.match(r'^(\d{4}-\d{2}-\d{2})\s+(\d{2}:\d{2}:\d{2})$', date_input)
+    datetime_match = _ABS_DT_RE.match(date_input)
     if datetime_match:
         date_part, time_part = datetime_match.groups()
         return parse_absolute_date(date_part, time_part)
@@ -138,7 +188,7 @@ def get_date_range(start_date: str, end_date: Optional[str] = None, reference_ti
         to include all meetings on that day. Start date uses 00:00:00.
     """
     if reference_time is None:
-        reference_time = datetime.datetime.now(get_cst_timezone())
+        reference_time = datetime.datetime.now(_CST_TZ)
 
     start_dt = parse_date(start_date, reference_time)
 
@@ -148,7 +198,7 @@ def get_date_range(start_date: str, end_date: Optional[str] = None, reference_ti
         end_dt = parse_date(end_date, reference_time)
         # If end_date was an absolute date (not relative), set time to end of day
         # to include all meetings on that date
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', end_date.strip()):
+        if _ABS_DATE_RE.match(end_date.strip()):
             end_dt = end_dt.replace(hour=23, minute=59, second=59)
 
     # Ensure start is before end